@@ -6,6 +6,30 @@ import lilio
 from lilio.calendar import Calendar
 
 
+_ANCHOR_YEAR_ATTRS = {"name": "anchor year", "units": "year"}
+_ANCHOR_YEAR_DESCRIPTION = (
+    "The anchor date is the start of the period you want to forecast, and is "
+    "an abstract date and does not include a year. "
+    "Anchor years are used to create a full date with the anchor date "
+    "(here: {anchor})."
+)
+_I_INTERVAL_ATTRS = {
+    "name": "interval index",
+    "units": "-",
+    "description": (
+        "The index of each Lilio Calendar interval. Positive values denote "
+        "intervals after the anchor date (targets), while negative values "
+        "represent intervals before the anchor date (precursors)."
+    ),
+}
+_IS_TARGET_ATTRS = {
+    "name": "Target flag",
+    "description": (
+        "Denotes if an interval was marked as a target interval in the Lilio Calendar."
+    ),
+}
+
+
 def add_attrs(data: Union[xr.DataArray, xr.Dataset], calendar: Calendar) -> None:
     """Update resampled xarray data with the Calendar's attributes and provenance."""
     history = (
@@ -25,28 +49,8 @@ def add_attrs(data: Union[xr.DataArray, xr.Dataset], calendar: Calendar) -> None
     }
 
     data["anchor_year"].attrs = {
-        "name": "anchor year",
-        "units": "year",
-        "description": (
-            "The anchor date is the start of the period you want to forecast, and is "
-            "an abstract date and does not include a year. "
-            "Anchor years are used to create a full date with the anchor date "
-            f"(here: {calendar.anchor})."
-        ),
-    }
-    data["i_interval"].attrs = {
-        "name": "interval index",
-        "units": "-",
-        "description": (
-            "The index of each Lilio Calendar interval. Positive values denote "
-            "intervals after the anchor date (targets), while negative values "
-            "represent intervals before the anchor date (precursors)."
-        ),
-    }
-    data["is_target"].attrs = {
-        "name": "Target flag",
-        "description": (
-            "Denotes if an interval was marked as a target interval in the"
-            " Lilio Calendar."
-        ),
+        **_ANCHOR_YEAR_ATTRS,
+        "description": _ANCHOR_YEAR_DESCRIPTION.format(anchor=calendar.anchor),
     }
+    data["i_interval"].attrs = dict(_I_INTERVAL_ATTRS)
+    data["is_target"].attrs = dict(_IS_TARGET_ATTRS)
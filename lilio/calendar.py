@@ -1,11 +1,14 @@
 """Lilio's main Calendar module."""
 
 import copy
+import functools
+import itertools
 import re
 import warnings
 from os import linesep
 from typing import Literal
 from typing import Union
+import numpy as np
 import pandas as pd
 import xarray as xr
 from pandas.tseries.offsets import DateOffset
@@ -17,10 +20,66 @@ _MappingYears = tuple[Literal["years"], int, int]
 _MappingData = tuple[Literal["data"], pd.Timestamp, pd.Timestamp]
 _MappingDataGreedy = tuple[Literal["data-greedy"], pd.Timestamp, pd.Timestamp]
 
+_ANCHOR_MONTH_DAY = re.compile(r"\d{1,2}-\d{1,2}")
+_ANCHOR_MONTH = re.compile(r"\d{1,2}")
+_ANCHOR_WEEK_DAY = re.compile(r"W\d{1,2}-\d")
+_ANCHOR_WEEK = re.compile(r"W\d{1,2}")
+
+# DateOffset keywords that always correspond to the same amount of time
+_FIXED_DURATION_UNITS = {
+    "weeks",
+    "days",
+    "hours",
+    "minutes",
+    "seconds",
+    "milliseconds",
+    "microseconds",
+    "nanoseconds",
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _get_offsets(
+    offset_items: tuple[tuple[str, int], ...],
+) -> tuple[DateOffset, Union[DateOffset, pd.Timedelta]]:
+    """Create the offsets for the (sorted) DateOffset keyword items.
+
+    Offsets are immutable, so intervals with the same length or gap can share them.
+
+    Returns:
+        The offset as a DateOffset, and the equivalent offset to use for calculations.
+            The latter is a Timedelta if the offset has a fixed duration, as adding a
+            Timedelta to (an index of) timestamps is plain integer arithmetic, while
+            a DateOffset has to take the calendar into account (e.g. for months).
+    """
+    # Pandas applies non-integer DateOffsets (e.g. days=1.5) inconsistently, so these
+    #   are not supported.
+    if not all(float(value).is_integer() for _, value in offset_items):
+        raise ValueError(
+            "Interval lengths and gaps have to be a whole number of units, not "
+            f"{dict(offset_items)}"
+        )
+    offset_kwargs = {unit: int(value) for unit, value in offset_items}
+    dateoffset = DateOffset(**offset_kwargs)
+    if offset_kwargs and set(offset_kwargs) <= _FIXED_DURATION_UNITS:
+        return dateoffset, pd.Timedelta(**offset_kwargs)
+    return dateoffset, dateoffset
+
 
 class Interval:
     """Basic construction element of calendar for defining precursors and targets."""
 
+    __slots__ = (
+        "_role",
+        "_target",
+        "_length",
+        "_length_dateoffset",
+        "_length_offset",
+        "_gap",
+        "_gap_dateoffset",
+        "_gap_offset",
+    )
+
     def __init__(
         self,
         role: Literal["target", "precursor"],
@@ -62,6 +121,9 @@ class Interval:
 
         self._gap_dateoffset: pd.DateOffset
         self._length_dateoffset: pd.DateOffset
+        # Equivalent offsets used for the calendar arithmetic
+        self._gap_offset: Union[pd.DateOffset, pd.Timedelta]
+        self._length_offset: Union[pd.DateOffset, pd.Timedelta]
 
         # TO DO: support lead_time
         # self.lead_time = lead_time
@@ -85,11 +147,10 @@ class Interval:
     def length(self, value: Union[str, dict]):
         self._length = value
         if isinstance(value, str):
-            self._length_dateoffset = DateOffset(
-                **utils.parse_freqstr_to_dateoffset(value)
-            )
-        else:
-            self._length_dateoffset = DateOffset(**value)
+            value = utils.cached_parse_freqstr_to_dateoffset(value)
+        self._length_dateoffset, self._length_offset = _get_offsets(
+            tuple(sorted(value.items()))
+        )
 
     @property
     def length_dateoffset(self):
@@ -105,11 +166,10 @@ class Interval:
     def gap(self, value: Union[str, dict]):
         self._gap = value
         if isinstance(value, str):
-            self._gap_dateoffset = DateOffset(
-                **utils.parse_freqstr_to_dateoffset(value)
-            )
-        else:
-            self._gap_dateoffset = DateOffset(**value)
+            value = utils.cached_parse_freqstr_to_dateoffset(value)
+        self._gap_dateoffset, self._gap_offset = _get_offsets(
+            tuple(sorted(value.items()))
+        )
 
     @property
     def gap_dateoffset(self):
@@ -127,6 +187,16 @@ class Interval:
         propstr = ", ".join([f"{k}={repr(v)}" for k, v in props])
         return f"{self.__class__.__name__}({propstr})"
 
+    def __deepcopy__(self, memo):
+        """Copy the interval. Only the length and gap dictionaries are mutable."""
+        interval = copy.copy(self)
+        if isinstance(self._length, dict):
+            interval._length = dict(self._length)
+        if isinstance(self._gap, dict):
+            interval._gap = dict(self._gap)
+        memo[id(self)] = interval
+        return interval
+
 
 class Calendar:
     """Build a calendar from scratch with basic construction elements."""
@@ -192,6 +262,7 @@ class Calendar:
 
         """
         self._anchor, self._anchor_fmt = self._parse_anchor(anchor)
+        self._anchor_cache: dict[int, pd.Timestamp] = {}
         self._allow_overlap = allow_overlap
         self.targets: list[Interval] = []
         self.precursors: list[Interval] = []
@@ -202,9 +273,14 @@ class Calendar:
         self._leftmost_time_bound: Union[None, pd.Timestamp] = None
         self._rightmost_time_bound: Union[None, pd.Timestamp] = None
 
+        # Cached results, stored with the fingerprint of the setup they are valid for
+        self._intervals_cache: Union[None, tuple[tuple, pd.DataFrame]] = None
+        self._skip_nyears_cache: Union[None, tuple[tuple, int]] = None
+        self._flat_cache: Union[None, tuple[tuple, pd.Series]] = None
+
         if intervals is not None:
-            # pylint: disable=expression-not-assigned
-            [self._append(iv) for iv in intervals]
+            for iv in intervals:
+                self._append(iv)
 
         self._mapping: Union[None, Literal["years", "data", "data-greedy"]]
         self._set_mapping(mapping)
@@ -227,6 +303,7 @@ class Calendar:
     @anchor.setter
     def anchor(self, value):
         self._anchor, self._anchor_fmt = self._parse_anchor(value)
+        self._anchor_cache = {}
 
     @property
     def allow_overlap(self):
@@ -300,8 +377,26 @@ class Calendar:
         Returns:
             pd.Timestamp: Timestamp at the end of the anchor_years interval 0.
         """
+        # Parsing is slow and the same years are requested repeatedly, so the
+        #   timestamps are cached (until the anchor is changed).
+        if year not in self._anchor_cache:
+            self._anchor_cache[year] = pd.to_datetime(
+                f"{year}-" + self._anchor, format="%Y-" + self._anchor_fmt
+            )
+        return self._anchor_cache[year]
+
+    def _get_anchors(self, years) -> pd.DatetimeIndex:
+        """Generate the anchor timestamps for multiple years, in a single parse.
+
+        Args:
+            years: anchor years for which the anchor timestamps should be generated
+
+        Returns:
+            pd.DatetimeIndex: Timestamps at the end of the anchor years' interval 0.
+        """
         return pd.to_datetime(
-            f"{year}-" + self._anchor, format="%Y-" + self._anchor_fmt
+            [f"{year}-" + self._anchor for year in years],
+            format="%Y-" + self._anchor_fmt,
         )
 
     def _parse_anchor(self, anchor_str: str) -> tuple[str, str]:
@@ -317,21 +412,21 @@ class Calendar:
         if not isinstance(anchor_str, str):
             raise ValueError("Anchor input must be a string with expected format.")
         # format match
-        if re.fullmatch("\\d{1,2}-\\d{1,2}", anchor_str):
+        if _ANCHOR_MONTH_DAY.fullmatch(anchor_str):
             utils.check_month_day(*[int(x) for x in anchor_str.split("-")])
             fmt = "%m-%d"
-        elif re.fullmatch("\\d{1,2}", anchor_str):
+        elif _ANCHOR_MONTH.fullmatch(anchor_str):
             utils.check_month_day(int(anchor_str))
             fmt = "%m"
-        elif re.fullmatch("W\\d{1,2}-\\d", anchor_str):
+        elif _ANCHOR_WEEK_DAY.fullmatch(anchor_str):
             utils.check_week_day(*[int(x) for x in anchor_str[1:].split("-")])
             fmt = "W%W-%w"
-        elif re.fullmatch("W\\d{1,2}", anchor_str):
+        elif _ANCHOR_WEEK.fullmatch(anchor_str):
             utils.check_week_day(int(anchor_str[1:]))
             fmt = "W%W-%w"
             anchor_str += "-1"
-        elif anchor_str.lower() in utils.get_month_names():
-            anchor_str = str(utils.get_month_names()[anchor_str.lower()])
+        elif anchor_str.lower() in utils.MONTH_NAMES:
+            anchor_str = str(utils.MONTH_NAMES[anchor_str.lower()])
             fmt = "%m"
         else:
             raise ValueError(
@@ -346,54 +441,67 @@ class Calendar:
         else:
             self.precursors.append(interval)
 
-    def _map_year(self, year: int) -> pd.Series:
-        """Return a concrete IntervalIndex for the given year.
+    def _map_years(self, years) -> pd.DataFrame:
+        """Return the concrete intervals for the given years.
 
         Since our calendars are used to study periodic events, they are first
-        instantiated without specific year(s). This method adds a specific year
-        to the calendar and returns an intervalindex, mapping the
-        Calendar to the given year.
+        instantiated without specific year(s). This method adds specific years
+        to the calendar and returns the intervals, mapping the Calendar to the
+        given years.
 
         Intended for internal use, in conjunction with map_years or map_to_data.
 
         Args:
-            year: The year for which the Calendar will be realized
+            years: The years for which the Calendar will be realized.
 
         Returns:
-            Pandas Series filled with Intervals of the calendar's frequency, counting
-            backwards from the calendar's achor.
+            Pandas DataFrame with a row of Intervals for every year, with the columns
+            counting backwards from the calendar's last target interval.
         """
-        intervals_target = self._concatenate_periods(year, self.targets, True)
-        intervals_precursor = self._concatenate_periods(year, self.precursors, False)
+        anchors = self._get_anchors(years)
+        intervals_target = self._concatenate_periods(anchors, self.targets, True)
+        intervals_precursor = self._concatenate_periods(anchors, self.precursors, False)
 
         year_intervals = intervals_precursor[::-1] + intervals_target
 
-        # turn the list of intervals into pandas series
-        year_intervals = pd.Series(year_intervals[::-1], name=year)
-        year_intervals.index.name = "i_interval"
-        return year_intervals
+        intervals = pd.DataFrame(
+            dict(enumerate(year_intervals[::-1])),
+            index=pd.Index(list(years), name="anchor_year"),
+        )
+        intervals.columns.name = "i_interval"
+        return intervals
 
-    def _concatenate_periods(self, year, list_periods, is_target):
-        # generate intervals based on the building blocks
+    def _concatenate_periods(
+        self, anchors: pd.DatetimeIndex, list_periods: list[Interval], is_target: bool
+    ) -> list[pd.arrays.IntervalArray]:
+        # generate intervals based on the building blocks, for all anchors at once
         intervals = []
         if is_target:
             # build from left to right
-            left_date = self._get_anchor(year)
+            left_date = anchors
             # loop through all the building blocks to
             for block in list_periods:
-                left_date += block.gap_dateoffset
-                right_date = left_date + block.length_dateoffset
-                intervals.append(pd.Interval(left_date, right_date, closed="left"))
+                left_date = left_date + block._gap_offset
+                right_date = left_date + block._length_offset
+                intervals.append(
+                    pd.arrays.IntervalArray.from_arrays(
+                        left_date, right_date, closed="left"
+                    )
+                )
                 # update left date
                 left_date = right_date
         else:
             # build from right to left
-            right_date = self._get_anchor(year)
+            right_date = anchors
             # loop through all the building blocks to
             for block in list_periods:
-                right_date -= block.gap_dateoffset
-                left_date = right_date - block.length_dateoffset
-                intervals.append(pd.Interval(left_date, right_date, closed="left"))
+                right_date = right_date - block._gap_offset
+                left_date = right_date - block._length_offset
+                intervals.append(
+                    pd.arrays.IntervalArray.from_arrays(
+                        left_date, right_date, closed="left"
+                    )
+                )
                 # update right date
                 right_date = left_date
 
@@ -410,24 +518,31 @@ class Calendar:
         if self._allow_overlap:
             return 0
 
+        fingerprint = self._fingerprint(include_mapping=False)
+        if self._skip_nyears_cache is not None:
+            cached_fingerprint, cached_skip_years = self._skip_nyears_cache
+            if cached_fingerprint == fingerprint:
+                return cached_skip_years
+
         proto_year = 2000
         skip_years = 0
 
         start_calendar = self._get_anchor(proto_year)
         for prec in self.precursors:
-            start_calendar -= prec.gap_dateoffset
-            start_calendar -= prec.length_dateoffset
+            start_calendar -= prec._gap_offset
+            start_calendar -= prec._length_offset
 
         while True:
             prev_end_calendar = self._get_anchor(proto_year - 1 - skip_years)
             for target in self.targets:
-                prev_end_calendar += target.gap_dateoffset
-                prev_end_calendar += target.length_dateoffset
+                prev_end_calendar += target._gap_offset
+                prev_end_calendar += target._length_offset
             if prev_end_calendar > start_calendar:
                 skip_years += 1
             else:
                 break
 
+        self._skip_nyears_cache = (fingerprint, skip_years)
         return skip_years
 
     def map_years(self, start: int, end: int):
@@ -472,9 +587,9 @@ class Calendar:
         left = input_data.index.min()
 
         if isinstance(input_data, (pd.Series, pd.DataFrame)):
-            freq = pd.infer_freq(input_data.index)
+            freq = input_data.index.inferred_freq
         else:
-            freq = xr.infer_freq(input_data["time"])
+            freq = input_data.indexes["time"].inferred_freq
 
         time_delta = pd.to_timedelta(freq, errors="coerce")
         if not pd.isna(time_delta):
@@ -516,8 +631,9 @@ class Calendar:
                 self._leftmost_time_bound = input_data.index.min()
                 self._rightmost_time_bound = input_data.index.max()
         else:
-            self._leftmost_time_bound = pd.Timestamp(input_data["time"].min().values)
-            self._rightmost_time_bound = pd.Timestamp(input_data["time"].max().values)
+            time_index = input_data.indexes["time"]
+            self._leftmost_time_bound = time_index.min()
+            self._rightmost_time_bound = time_index.max()
 
         self._mapping = "data" if safe else "data-greedy"
         self._first_year = None
@@ -529,31 +645,47 @@ class Calendar:
         min_year = self._leftmost_time_bound.year - 1  # type: ignore
         max_year = self._rightmost_time_bound.year + 1  # type: ignore
 
+        # Map all candidate years at once, and find the first and last interval of
+        #   every year (intervals are ordered by their left bound, then right bound)
+        years = np.arange(min_year, max_year + 1)
+        intervals = self._map_years(years)
+        lefts = np.column_stack([intervals[col].array.left for col in intervals])
+        rights = np.column_stack([intervals[col].array.right for col in intervals])
+        lefts, rights = lefts.view("i8"), rights.view("i8")
+
+        first_left = lefts.min(axis=1)
+        first_right = np.where(
+            lefts == first_left[:, np.newaxis], rights, np.iinfo(np.int64).max
+        ).min(axis=1)
+        last_left = lefts.max(axis=1)
+        last_right = np.where(
+            lefts == last_left[:, np.newaxis], rights, np.iinfo(np.int64).min
+        ).max(axis=1)
+
+        leftmost_time_bound = pd.Timestamp(self._leftmost_time_bound).value
+        rightmost_time_bound = pd.Timestamp(self._rightmost_time_bound).value
+
         # ensure that the input data could always cover the advent calendar
         if self._mapping == "data":
-            # last date check
-            while self._map_year(max_year).max().right > self._rightmost_time_bound:
-                max_year -= 1
-            # first date check
-            while self._map_year(min_year).min().left < self._leftmost_time_bound:
-                min_year += 1
-
+            valid_last_year = last_right <= rightmost_time_bound
+            valid_first_year = first_left >= leftmost_time_bound
         else:  # greedy mode
-            while self._map_year(max_year).max().left > self._rightmost_time_bound:
-                max_year -= 1
-            while self._map_year(min_year).min().right < self._leftmost_time_bound:
-                min_year += 1
+            valid_last_year = last_left <= rightmost_time_bound
+            valid_first_year = first_right >= leftmost_time_bound
+
+        # The intervals move forward in time with the anchor year, so the last (first)
+        #   valid year is the latest (earliest) year that fits within the bounds.
+        last_years = years[valid_last_year]
+        first_years = years[valid_first_year]
 
         # map year(s) and generate year realized advent calendar
-        if max_year >= min_year:
-            self._first_year = min_year
-            self._last_year = max_year
-        else:
-            raise ValueError(
-                "The input data could not cover the target advent calendar."
-            )
+        if last_years.size > 0 and first_years.size > 0:
+            if last_years.max() >= first_years.min():
+                self._first_year = int(first_years.min())
+                self._last_year = int(last_years.max())
+                return self
 
-        return self
+        raise ValueError("The input data could not cover the target advent calendar.")
 
     def _set_mapping(self, mapping):
         if mapping is None:
@@ -580,20 +712,42 @@ class Calendar:
             pd.Dataframe: Dataframe with target periods labelled, sorted by their
                 i_interval value.
         """
-        # rename precursors
-        intervals = intervals.rename(
-            columns={
-                i: self.n_targets - i - 1
-                for i in range(self.n_targets, len(intervals.columns))
-            }
-        )
+        # The columns count down from the last target: label the targets n_targets
+        #   to 1, and the precursors -1 onwards (there is no interval 0).
+        i_interval = self.n_targets - np.arange(intervals.shape[1])
+        i_interval[self.n_targets :] -= 1
+
+        # As the labels are descending, reversing the columns sorts them
+        intervals = intervals.iloc[:, ::-1]
+        intervals.columns = pd.Index(i_interval[::-1], name=intervals.columns.name)
+        return intervals
 
-        # rename targets
-        intervals = intervals.rename(
-            columns={i: self.n_targets - i for i in range(self.n_targets)}
-        )
+    def _fingerprint(self, include_mapping: bool = True) -> tuple:
+        """Summarize the calendar's setup, to check if cached results are still valid.
 
-        return intervals.sort_index(axis=1)
+        The intervals are part of the fingerprint by value, as they can be modified
+        in-place (e.g. `calendar.targets[0].gap = "5d"`).
+
+        Args:
+            include_mapping: If the calendar's mapping should be part of the
+                fingerprint. Defaults to True.
+        """
+        fingerprint: tuple = (
+            self._anchor,
+            self._anchor_fmt,
+            self._allow_overlap,
+            tuple(
+                (iv.role, repr(iv.length), repr(iv.gap))
+                for iv in self.targets + self.precursors
+            ),
+        )
+        if not include_mapping:
+            return fingerprint
+        if self._mapping == "years":
+            mapping_bounds = (self._first_year, self._last_year)
+        else:
+            mapping_bounds = (self._leftmost_time_bound, self._rightmost_time_bound)
+        return (*fingerprint, self._mapping, mapping_bounds)
 
     def get_intervals(self) -> pd.DataFrame:
         """Retrieve updated intervals from the Calendar object."""
@@ -602,6 +756,13 @@ class Calendar:
                 "Cannot retrieve intervals without map_years or "
                 "map_to_data having configured the calendar."
             )
+
+        fingerprint = self._fingerprint()
+        if self._intervals_cache is not None:
+            cached_fingerprint, cached_intervals = self._intervals_cache
+            if cached_fingerprint == fingerprint:
+                return cached_intervals.copy()
+
         if self._mapping in ["data", "data-greedy"]:
             self._set_year_range_from_timestamps()
 
@@ -611,12 +772,13 @@ class Calendar:
             -(self._get_skip_nyears() + 1),  # type: ignore
         )
 
-        intervals = pd.concat([self._map_year(year) for year in year_range], axis=1).T
+        intervals = self._map_years(year_range)
 
         intervals = self._rename_intervals(intervals)
+        intervals = intervals.sort_index(axis=0, ascending=False)
 
-        intervals.index.name = "anchor_year"
-        return intervals.sort_index(axis=0, ascending=False)
+        self._intervals_cache = (fingerprint, intervals)
+        return intervals.copy()
 
     def show(self) -> pd.DataFrame:
         """Display the intervals the Calendar will generate for the current setup.
@@ -634,10 +796,10 @@ class Calendar:
 
     def __repr__(self) -> str:
         """Return a string representation of the Calendar."""
-        intervals = self.targets + self.precursors
-        if len(intervals) == 0:
+        if not self.targets and not self.precursors:
             intervals_str = repr(None)
         else:
+            intervals = itertools.chain(self.targets, self.precursors)
             intervals_str = (
                 f"[{linesep}\t\t"
                 + f",{linesep}\t\t".join([repr(iv) for iv in intervals])
@@ -661,6 +823,19 @@ class Calendar:
         propstr = f"{linesep}\t" + f",{linesep}\t".join([f"{k}={v}" for k, v in props])
         return f"{self.__class__.__name__}({propstr}{linesep})".replace("\t", "    ")
 
+    def __deepcopy__(self, memo):
+        """Copy the calendar, deep copying only its (mutable) intervals.
+
+        The other attributes are immutable, or are only replaced and never modified in
+        place, so they can be shared with the copy.
+        """
+        calendar = copy.copy(self)
+        memo[id(self)] = calendar
+        calendar._anchor_cache = dict(self._anchor_cache)
+        calendar.targets = [copy.deepcopy(iv, memo) for iv in self.targets]
+        calendar.precursors = [copy.deepcopy(iv, memo) for iv in self.precursors]
+        return calendar
+
     def visualize(  # noqa: PLR0913 (too-many-arguments)
         self,
         n_years: int = 3,
@@ -693,7 +868,8 @@ class Calendar:
                 https://docs.bokeh.org/en/latest/docs/reference/plotting/figure.html
                 for a list of possible keyword arguments.
         """
-        calendar = copy.deepcopy(self)
+        # Only the mapping of the copy is modified, so a shallow copy suffices
+        calendar = copy.copy(self)
         if calendar._mapping is None:  # pylint: disable=protected-access
             calendar.map_years(2000, 2000)
             if not relative_dates:
@@ -748,4 +924,12 @@ class Calendar:
     @property
     def flat(self) -> pd.DataFrame:
         """Returns the flattened intervals."""
-        return self.get_intervals().stack()  # type: ignore
+        fingerprint = self._fingerprint()
+        if self._flat_cache is not None:
+            cached_fingerprint, cached_flat = self._flat_cache
+            if cached_fingerprint == fingerprint:
+                return cached_flat.copy()  # type: ignore
+
+        flat = self.get_intervals().stack()
+        self._flat_cache = (fingerprint, flat)
+        return flat.copy()  # type: ignore
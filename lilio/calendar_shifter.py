@@ -1,7 +1,9 @@
 """Calendar shifter to create staggered calendars."""
 
 import copy
+from collections.abc import Iterator
 from typing import Union
+import pandas as pd
 import xarray as xr
 from lilio import calendar
 from lilio import utils
@@ -24,22 +26,19 @@ def _gap_shift(
         A Pandas DateOffset compatible dictionary, with the gap offset by shift
     """
     if isinstance(interval.gap, str):
-        gap_time_dict = utils.parse_freqstr_to_dateoffset(interval.gap)
+        gap_time_dict = utils.cached_parse_freqstr_to_dateoffset(interval.gap)
     else:
         gap_time_dict = interval.gap
 
     if isinstance(shift, str):
-        shift_time_dict = utils.parse_freqstr_to_dateoffset(shift)
+        shift_time_dict = utils.cached_parse_freqstr_to_dateoffset(shift)
     else:
         shift_time_dict = shift
     # make the shift negative for the precursor to shift forward in time
-    if interval.role == "precursor":
-        shift_time_dict.update(
-            (key, value * -1) for key, value in shift_time_dict.items()
-        )
+    sign = -1 if interval.role == "precursor" else 1
     return {
-        k: gap_time_dict.get(k, 0) + shift_time_dict.get(k, 0)
-        for k in set(gap_time_dict) | set(shift_time_dict)
+        k: gap_time_dict.get(k, 0) + sign * shift_time_dict.get(k, 0)
+        for k in {**gap_time_dict, **shift_time_dict}
     }
 
 
@@ -86,7 +85,13 @@ def calendar_shifter(
             ]
         )
     """
+    if isinstance(shift, str):
+        shift = utils.cached_parse_freqstr_to_dateoffset(shift)
+
     calendar_shifted = copy.deepcopy(calendar)
+    if not any(shift.values()):  # a zero shift leaves the gaps as they are
+        return calendar_shifted
+
     calendar_shifted.targets[0].gap = _gap_shift(calendar.targets[0], shift)
     calendar_shifted.precursors[0].gap = _gap_shift(calendar.precursors[0], shift)
 
@@ -141,7 +146,14 @@ def staggered_calendar(
             ]
         )]
     """
-    if not isinstance(n_shifts, int):
+    return list(_iter_staggered(calendar, shift, n_shifts))
+
+
+def _iter_staggered(
+    calendar: calendar.Calendar, shift: Union[str, dict], n_shifts: int
+) -> Iterator[calendar.Calendar]:
+    """Yield the input calendar, followed by the calendar shifted 1 to n times."""
+    if not isinstance(n_shifts, int) or isinstance(n_shifts, bool):
         raise ValueError(
             "Please input an 'int' type for the 'n' argument."
             f" Not a {type(n_shifts)}."
@@ -150,12 +162,14 @@ def staggered_calendar(
         raise ValueError(
             "The number of shifts 'n' has to be 1 or greater, " f"not '{n_shifts}'."
         )
-    cal_staggered = [calendar]
-    for _ in range(n_shifts):
-        cal_shifted = calendar_shifter(cal_staggered[-1], shift)
-        cal_staggered.append(cal_shifted)
+    if isinstance(shift, str):
+        shift = utils.cached_parse_freqstr_to_dateoffset(shift)
 
-    return cal_staggered
+    # Shift the original calendar by i times the shift, instead of shifting the
+    #   previous calendar, so that the calendars do not depend on each other.
+    yield calendar
+    for i in range(1, n_shifts + 1):
+        yield calendar_shifter(calendar, {k: i * v for k, v in shift.items()})
 
 
 def calendar_list_resampler(
@@ -175,7 +189,41 @@ def calendar_list_resampler(
     Returns:
         Resampled xr.Dataset
     """
-    ds_r = xr.concat([resample(cal, ds) for cal in cal_list], dim=dim_name)
-    ds_r = ds_r.assign_coords({dim_name: ds_r[dim_name].values})
+    ds_r = xr.concat(
+        [resample(cal, ds) for cal in cal_list],
+        dim=pd.Index(range(len(cal_list)), name=dim_name),
+    )
 
     return ds_r
+
+
+def staggered_resample(
+    calendar: calendar.Calendar,
+    ds: xr.Dataset,
+    shift: Union[str, dict],
+    n_shifts: int,
+    dim_name: str = "step",
+) -> xr.Dataset:
+    """Resample a dataset to a calendar, staggered n times by an offset.
+
+    Equivalent to resampling the dataset with `calendar_list_resampler` to the list of
+    calendars created by `staggered_calendar`, but the shifted calendars are only
+    created while resampling, instead of all being kept in a list.
+
+    Args:
+        calendar: a lilio.Calendar instance, mapped to the data.
+        ds: Dataset to resample.
+        shift: a pandas-like
+            frequency string (e.g. "10d", "2W", or "3M"), or a pandas.DateOffset
+            compatible dictionary such as {days=10}, {weeks=2}, or {months=1, weeks=2}
+        n_shifts: strictly positive integer for the number of shifts
+        dim_name: The name of the new dimension that will be added to the output
+            dataset.
+
+    Returns:
+        Resampled xr.Dataset
+    """
+    return xr.concat(
+        [resample(cal, ds) for cal in _iter_staggered(calendar, shift, n_shifts)],
+        dim=pd.Index(range(n_shifts + 1), name=dim_name),
+    )
@@ -1,10 +1,22 @@
 """Shorthands for calendars, to make generating commonly used calendars a one-liner."""
 
 import re
-import pandas as pd
 from .calendar import Calendar
 
 
+_DAILY_LENGTH = re.compile(r"\d*d")
+_WEEKLY_LENGTH = re.compile(r"\d*W")
+_MONTHLY_LENGTH = re.compile(r"\d*M")
+
+
+_DAYS_PER_UNIT = {"d": 1, "W": 7}
+
+
+def _periods_per_year(length: str) -> int:
+    """Return the number of intervals of a day or week based length in a year."""
+    return 365 // (int(length[:-1]) * _DAYS_PER_UNIT[length[-1]])
+
+
 def daily_calendar(
     anchor: str,
     length: str = "1d",
@@ -58,12 +70,10 @@ def daily_calendar(
         )
 
     """
-    if not re.fullmatch(r"\d*d", length):
+    if not _DAILY_LENGTH.fullmatch(length):
         raise ValueError("Please input a frequency in the form of '2d'")
-    periods_per_year = pd.Timedelta("365days") / pd.to_timedelta(length)
-    n_intervals = (
-        (n_precursors + n_targets) if n_precursors > 0 else int(periods_per_year)
-    )
+    periods_per_year = _periods_per_year(length)
+    n_intervals = (n_precursors + n_targets) if n_precursors > 0 else periods_per_year
     n_precursors = n_intervals - n_targets
 
     cal = Calendar(anchor=anchor, allow_overlap=allow_overlap)
@@ -131,12 +141,10 @@ def weekly_calendar(
         )
 
     """
-    if not re.fullmatch(r"\d*W", length):
+    if not _WEEKLY_LENGTH.fullmatch(length):
         raise ValueError("Please input a frequency in the form of '4W'")
-    periods_per_year = pd.Timedelta("365days") / pd.to_timedelta(length)
-    n_intervals = (
-        (n_precursors + n_targets) if n_precursors > 0 else int(periods_per_year)
-    )
+    periods_per_year = _periods_per_year(length)
+    n_intervals = (n_precursors + n_targets) if n_precursors > 0 else periods_per_year
     n_precursors = n_intervals - n_targets
 
     cal = Calendar(anchor=anchor, allow_overlap=allow_overlap)
@@ -203,12 +211,10 @@ def monthly_calendar(
         )
 
     """
-    if not re.fullmatch(r"\d*M", length):
+    if not _MONTHLY_LENGTH.fullmatch(length):
         raise ValueError("Please input a frequency in the form of '2M'")
-    periods_per_year = 12 / int(length.replace("M", ""))
-    n_intervals = (
-        (n_precursors + n_targets) if n_precursors > 0 else int(periods_per_year)
-    )
+    periods_per_year = 12 // int(length.removesuffix("M"))
+    n_intervals = (n_precursors + n_targets) if n_precursors > 0 else periods_per_year
     n_precursors = n_intervals - n_targets
 
     cal = Calendar(anchor=anchor, allow_overlap=allow_overlap)
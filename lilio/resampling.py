@@ -32,6 +32,20 @@ ResamplingMethod = Literal[
     "count_nonzero",
 ]
 VALID_METHODS = typing.get_args(ResamplingMethod)
+_METHOD_FUNCTIONS = {method: getattr(np, method) for method in VALID_METHODS}
+# Methods that can be computed with ufunc.reduceat, and the dtype kinds they support.
+#   Reducing all slices at once avoids the overhead of a numpy call per slice, which is
+#   only significant if the slices contain (on average) few timesteps.
+_REDUCEAT_METHODS = {
+    "sum": "f",
+    "nansum": "f",
+    "mean": "f",
+    "nanmean": "f",
+    "min": "iuf",
+    "max": "iuf",
+    "ptp": "iuf",
+}
+_REDUCEAT_MAX_SLICE_SIZE = 2048
 
 
 def _check_valid_resampling_methods(method: ResamplingMethod):
@@ -64,10 +78,7 @@ def _mark_target_period(
             given inputs.
     """
     if isinstance(input_data, (pd.Series, pd.DataFrame)):
-        input_data["is_target"] = np.ones(input_data.index.size, dtype=bool)
-        input_data["is_target"] = input_data["is_target"].where(
-            input_data["i_interval"] > 0, other=False
-        )
+        input_data["is_target"] = input_data["i_interval"].to_numpy() > 0
 
     else:
         # input data is xr.Dataset
@@ -92,12 +103,17 @@ def _resample_bins_constructor(
     """
     # Make a tidy dataframe where the intervals are linked to the anchor year
     if isinstance(intervals, pd.DataFrame):
-        bins = intervals.copy()
-        bins.index.rename("anchor_year", inplace=True)
-        bins = bins.melt(
-            var_name="i_interval", value_name="interval", ignore_index=False
+        # Lay out the rows by anchor year, then by interval
+        years, i_intervals, lefts, rights, closed = _sorted_interval_grid(intervals)
+        bins = pd.DataFrame(
+            {
+                "anchor_year": np.repeat(years, i_intervals.size),
+                "i_interval": np.tile(i_intervals, years.size),
+                "interval": pd.arrays.IntervalArray.from_arrays(
+                    lefts.ravel(), rights.ravel(), closed=closed
+                ),
+            }
         )
-        bins = bins.sort_values(by=["anchor_year", "i_interval"])
     else:
         # Massage the dataframe into the same tidy format for a single year
         bins = pd.DataFrame(intervals)
@@ -105,33 +121,220 @@ def _resample_bins_constructor(
             var_name="anchor_year", value_name="interval", ignore_index=False
         )
         bins.index.rename("i_interval", inplace=True)
-    bins = bins.reset_index()
+        bins = bins.reset_index()
 
     return bins
 
 
-def _contains(interval_index: pd.IntervalIndex, timestamps) -> np.ndarray:
-    """Check elementwise if the intervals contain the timestamps.
+def _sorted_interval_grid(
+    intervals: pd.DataFrame,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, str]:
+    """Lay out the intervals on a grid sorted by anchor year and i_interval.
+
+    Only the bounds are gathered, so no `pd.Interval` objects are created and the
+    DataFrame itself is not copied.
+
+    Args:
+        intervals: The intervals of a mapped calendar, as returned by
+            `Calendar.get_intervals`.
+
+    Returns:
+        The sorted anchor years and i_intervals, the left and right bounds as 2-D
+            datetime64 arrays of shape (n_anchor_years, n_intervals), and the side on
+            which the intervals are closed.
+    """
+    year_order = np.argsort(intervals.index.values, kind="stable")
+    column_order = np.argsort(intervals.columns.values, kind="stable")
+    columns = [intervals.iloc[:, i].array for i in column_order]
+    lefts = np.column_stack([col.left for col in columns])[year_order]
+    rights = np.column_stack([col.right for col in columns])[year_order]
+    return (
+        intervals.index.values[year_order],
+        intervals.columns.values[column_order],
+        lefts,
+        rights,
+        columns[0].closed,
+    )
+
+
+def _get_interval_slices(
+    intervals: Union[pd.IntervalIndex, pd.arrays.IntervalArray], timestamps: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the range of (sorted) timestamps that falls within each interval.
+
+    As the timestamps are sorted, the timestamps that are contained by an interval form
+    a contiguous block. The bounds of these blocks are found with a binary search,
+    instead of comparing every timestamp to every interval.
+
+    Args:
+        intervals: An IntervalIndex or IntervalArray containing all intervals that
+            should be checked.
+        timestamps: A sorted 1-D array containing the timestamps.
+
+    Returns:
+        Two 1-D arrays with the start and stop indices of each interval, such that
+            `timestamps[starts[i]:stops[i]]` are the timestamps within interval i.
+    """
+    # Compare as integers (nanoseconds since epoch), avoiding datetime64 overhead
+    timestamps_ns = _to_int64_ns(timestamps)
+    starts = np.searchsorted(
+        timestamps_ns,
+        _to_int64_ns(intervals.left.values),
+        side="left" if intervals.closed_left else "right",
+    )
+    stops = np.searchsorted(
+        timestamps_ns,
+        _to_int64_ns(intervals.right.values),
+        side="right" if intervals.closed_right else "left",
+    )
+    return starts, np.maximum(starts, stops)
+
 
-    Will return a boolean array of the shape (n_timestamps, n_intervals).
+def _to_int64_ns(timestamps: np.ndarray) -> np.ndarray:
+    """View datetime64 values as int64 nanoseconds (casting to ns if required)."""
+    return np.asarray(timestamps).astype("datetime64[ns]", copy=False).view("i8")
+
+
+def _resample_slices(
+    values: np.ndarray,
+    starts: np.ndarray,
+    stops: np.ndarray,
+    how: Union[ResamplingMethod, Callable[[np.ndarray], np.ndarray]],
+) -> np.ndarray:
+    """Resample the values to every slice of their last (time) axis.
 
     Args:
-        interval_index: An IntervalIndex containing all intervals that should be
-            checked.
-        timestamps: A 1-D array containing
+        values: Array with the sorted time dimension as its last axis.
+        starts: Index of the first timestep of every interval.
+        stops: Index after the last timestep of every interval.
+        how: Which resampling method should be used. Can also be a function that takes a
+            single input argument and has a single output argument.
 
     Returns:
-        np.ndarray: 2-D mask array
+        np.ndarray: Resampled array, with the intervals as the last axis.
     """
-    if interval_index.closed_left:
-        a = np.greater_equal(timestamps, interval_index.left.values[np.newaxis].T)
+    sizes = stops - starts
+    if how == "size":
+        return np.broadcast_to(sizes, (*values.shape[:-1], sizes.size)).copy()
+
+    if sizes.size > 0 and np.all(sizes == sizes[0]):
+        # All intervals contain the same number of timesteps (e.g. the input is
+        #   already at the calendar's frequency). Gather the windows into a new axis
+        #   and reduce them all at once.
+        windows = values[..., starts[:, np.newaxis] + np.arange(sizes[0])]
+        if isinstance(how, str):
+            return _METHOD_FUNCTIONS[how](windows, axis=-1)
+        return np.apply_along_axis(how, -1, windows)
+    if (
+        isinstance(how, str)
+        and values.dtype.kind in _REDUCEAT_METHODS.get(how, "")
+        and values.shape[-1] <= _REDUCEAT_MAX_SLICE_SIZE * sizes.size
+        and (how not in ("min", "max", "ptp") or np.all(sizes > 0))
+    ):
+        return _resample_reduceat(values, starts, stops, how)
+
+    if isinstance(how, str):
+        method = _METHOD_FUNCTIONS[how]
+        resampled = [
+            np.broadcast_to(method(values[..., start:stop], axis=-1), values.shape[:-1])
+            for start, stop in zip(starts, stops)
+        ]
     else:
-        a = np.greater(timestamps, interval_index.left.values[np.newaxis].T)
-    if interval_index.closed_right:
-        b = np.less_equal(timestamps, interval_index.right.values[np.newaxis].T)
+        resampled = [
+            np.apply_along_axis(how, -1, values[..., start:stop])
+            for start, stop in zip(starts, stops)
+        ]
+    return np.stack(resampled, axis=-1)
+
+
+def _reduce_slices(
+    ufunc: np.ufunc,
+    values: np.ndarray,
+    starts: np.ndarray,
+    stops: np.ndarray,
+    dtype: Union[None, np.dtype] = None,
+) -> np.ndarray:
+    """Reduce every slice of the last axis of an array with a single reduceat call.
+
+    ufunc.reduceat reduces from each index up to the next index, so with the starts and
+    stops interleaved the even outputs are the reduced slices. All indices have to be
+    valid, so stops at the end of the array are moved onto the last element, which is
+    included again afterwards. Note that empty slices are not handled.
+    """
+    last = values.shape[-1] - 1
+    indices = np.minimum(np.column_stack([starts, stops]).ravel(), last)
+    if values.flags.c_contiguous:
+        reduced = ufunc.reduceat(values, indices, axis=-1, dtype=dtype)[..., ::2]
+    else:  # Transposed input: reduce along the original (contiguous) time axis
+        reduced = ufunc.reduceat(
+            np.moveaxis(values, -1, 0), indices, axis=0, dtype=dtype
+        )[::2]
+        reduced = np.moveaxis(reduced, 0, -1)
+
+    at_end = (stops > last) & (starts < last)
+    reduced[..., at_end] = ufunc(reduced[..., at_end], values[..., last:])
+    return reduced
+
+
+def _sum_slices(
+    values: np.ndarray, starts: np.ndarray, stops: np.ndarray
+) -> np.ndarray:
+    """Sum every slice of the last axis, accumulating in (at least) double precision."""
+    dtype = np.promote_types(values.dtype, np.float64)
+    sums = _reduce_slices(np.add, values, starts, stops, dtype=dtype)
+    sums[..., stops == starts] = 0  # reduceat returns the value at the index instead
+    return sums
+
+
+def _resample_reduceat(
+    values: np.ndarray,
+    starts: np.ndarray,
+    stops: np.ndarray,
+    how: str,
+) -> np.ndarray:
+    """Resample values without looping over the slices, see _REDUCEAT_METHODS."""
+    if how in ("min", "max", "ptp"):
+        if how == "min":
+            return _reduce_slices(np.minimum, values, starts, stops)
+        maxima = _reduce_slices(np.maximum, values, starts, stops)
+        if how == "max":
+            return maxima
+        return maxima - _reduce_slices(np.minimum, values, starts, stops)
+
+    if how in ("nansum", "nanmean"):
+        is_valid = ~np.isnan(values)
+        sums = _sum_slices(np.where(is_valid, values, 0), starts, stops)
+        counts = _sum_slices(is_valid, starts, stops)
     else:
-        b = np.less(timestamps, interval_index.right.values[np.newaxis].T)
-    return a & b
+        sums = _sum_slices(values, starts, stops)
+        counts = (stops - starts).astype(sums.dtype)
+
+    if how in ("sum", "nansum"):
+        return sums.astype(values.dtype)
+    with np.errstate(invalid="ignore"):  # Empty slices have a mean of NaN
+        return (sums / counts).astype(values.dtype)
+
+
+def _dask_output_dtypes(
+    data: xr.DataArray,
+    how: Union[ResamplingMethod, Callable[[np.ndarray], np.ndarray]],
+) -> Union[None, list[np.dtype]]:
+    """Infer the dtype of Dask-backed data after it has been resampled.
+
+    Only Dask needs to know the output dtype in advance. Functions passed as `how`
+    are not called on dummy data to find it, as they might not support that input.
+    Their output is assumed to be at least float64 instead (e.g. the mean of integers),
+    like the output of resampling pandas data.
+    """
+    if data.chunks is None:
+        return None
+    if not isinstance(how, str):
+        return [np.result_type(data.dtype, np.float64)]
+    return [
+        _resample_slices(
+            np.ones(1, dtype=data.dtype), np.array([0]), np.array([1]), how
+        ).dtype
+    ]
 
 
 def _resample_pandas(
@@ -151,26 +354,32 @@ def _resample_pandas(
         pd.DataFrame: DataFrame containing the intervals and data resampled to
             these intervals.
     """
-    resampling_method = getattr(np, how) if isinstance(how, str) else how
-
     if isinstance(input_data, pd.Series):
         name = "data" if input_data.name is None else input_data.name
         input_data = pd.DataFrame(input_data.rename(name))
 
     data = _resample_bins_constructor(calendar.get_intervals())
-    contains_matrix = _contains(
-        pd.IntervalIndex(data.interval.values), input_data.index.values
-    )
-
-    utils.check_empty_intervals(
-        indices_list=[np.argwhere(row).T[0] for row in contains_matrix]
-    )
-
+    timestamps = input_data.index.values
+    if input_data.index.is_monotonic_increasing:  # No need to sort (or copy) the data
+        order: Union[slice, np.ndarray] = slice(None)
+    else:
+        order = np.argsort(timestamps, kind="stable")
+    starts, stops = _get_interval_slices(data["interval"].array, timestamps[order])
+
+    utils.check_empty_intervals(stops - starts)
+
+    # Resample columns of the same dtype at once, with the (sorted) time axis last.
+    #   Grouping by dtype avoids e.g. float32 columns being upcast to float64. Other
+    #   results (e.g. of integer columns, or how="size") are returned as float64.
+    resampled_data = {}
+    for columns in input_data.columns.groupby(input_data.dtypes).values():
+        block = input_data[columns].to_numpy()[order].T
+        resampled_block = _resample_slices(block, starts, stops, how)
+        if resampled_block.dtype.kind != "f":
+            resampled_block = resampled_block.astype(np.float64)
+        resampled_data.update(zip(columns, resampled_block))
     for colname in input_data.columns:
-        resampled_data = np.zeros(contains_matrix.shape[0])
-        for i, row in enumerate(contains_matrix):
-            resampled_data[i] = resampling_method(input_data[colname].values[row])
-        data[colname] = resampled_data
+        data[colname] = resampled_data[colname]
 
     return data
 
@@ -193,44 +402,82 @@ def _resample_dataset(
         xr.Dataset: Dataset containing the intervals and data resampled to
             these intervals.
     """
-    resampling_method = getattr(np, how) if isinstance(how, str) else how
-    data = calendar.flat.to_xarray().rename("interval")
-    data = data.to_dataset()
-    data = data.stack(anch_int=("anchor_year", "i_interval"))
-
-    intervals = pd.IntervalIndex(data["interval"].values)
+    # Lay out the intervals on an (anchor_year, i_interval) grid, sorted along both
+    #   axes. The data is resampled straight into this layout, so the output does not
+    #   need to be stacked, unstacked or sorted afterwards.
+    years, i_intervals, lefts, rights, closed = _sorted_interval_grid(
+        calendar.get_intervals()
+    )
+    intervals = pd.arrays.IntervalArray.from_arrays(
+        lefts.ravel(), rights.ravel(), closed=closed
+    )
     timesteps = input_data["time"].to_numpy()
 
-    indices_list: list[np.ndarray] = [np.ndarray(0)] * len(intervals)
-    for i in range(len(intervals)):
-        row = _contains(intervals[[i]], timesteps)[0]
-        indices_list[i] = np.argwhere(row).T[0]
+    order = np.argsort(timesteps, kind="stable")
+    starts, stops = _get_interval_slices(intervals, timesteps[order])
+
+    utils.check_empty_intervals(stops - starts)
 
-    utils.check_empty_intervals(indices_list)
+    # Only the timesteps within the calendar's intervals are required for resampling
+    first, last = starts.min(), stops.max()
+    starts, stops = starts - first, stops - first
+    if np.all(order[1:] > order[:-1]):
+        time_indexer: Union[slice, np.ndarray] = slice(first, last)
+    else:
+        time_indexer = order[first:last]
 
     # Separate data with time dims (should be resampled), from data without time dims
     #   (which does not need resampling).
     input_data_time = input_data[
         [var for var in input_data.data_vars if "time" in input_data[var].dims]
-    ]
+    ].isel(time=time_indexer)
     input_data_nontime = input_data[
         [var for var in input_data.data_vars if "time" not in input_data[var].dims]
     ]
 
-    data_list = [xr.Dataset] * len(intervals)
-    for i in range(len(intervals)):
-        data_list[i] = xr.apply_ufunc(
-            resampling_method,
-            input_data_time.isel(time=indices_list[i]),
-            input_core_dims=[["time"]],
-            output_core_dims=[[]],
-            vectorize=True,
-            dask="parallelized",  # only does something when data is a Dask array
-            dask_gufunc_kwargs={"allow_rechunk": True},  # Same as above
-        )
-
-    input_data_resampled = xr.concat(data_list, dim="anch_int")  # type: ignore
+    def resample_to_grid(values: np.ndarray) -> np.ndarray:
+        resampled = _resample_slices(values, starts, stops, how)
+        return resampled.reshape(*resampled.shape[:-1], *lefts.shape)
+
+    input_data_resampled = xr.Dataset(
+        {
+            var: xr.apply_ufunc(
+                resample_to_grid,
+                input_data_time[var],
+                input_core_dims=[["time"]],
+                output_core_dims=[["anchor_year", "i_interval"]],
+                dask="parallelized",  # only does something when data is a Dask array
+                output_dtypes=_dask_output_dtypes(input_data_time[var], how),
+                dask_gufunc_kwargs={  # Same as above
+                    "allow_rechunk": True,
+                    "output_sizes": {
+                        "anchor_year": lefts.shape[0],
+                        "i_interval": lefts.shape[1],
+                    },
+                },
+            )
+            for var in input_data_time.data_vars
+        }
+    )
 
+    # The intervals are stored as their bounds, as pd.Interval objects cannot be
+    #   written to netCDF.
+    data = xr.Dataset(
+        coords={
+            "anchor_year": years,
+            "i_interval": i_intervals,
+            "left_bound": (
+                ("anchor_year", "i_interval"),
+                lefts,
+                {"name": "Left bound of the interval", "closed": "True"},
+            ),
+            "right_bound": (
+                ("anchor_year", "i_interval"),
+                rights,
+                {"name": "Right bound of the interval", "closed": "False"},
+            ),
+        }
+    )
     if input_data_nontime.data_vars:
         data = xr.merge(
             [data, input_data_nontime, input_data_resampled]  # type: ignore
@@ -238,10 +485,7 @@ def _resample_dataset(
     else:
         data = xr.merge([data, input_data_resampled])  # type: ignore
 
-    data = data.unstack()
-    data = utils.convert_interval_to_bounds(data)
-    data = data.transpose("anchor_year", "i_interval", ...)
-    return data.sortby("anchor_year", "i_interval")
+    return data.transpose("anchor_year", "i_interval", ...)
 
 
 @overload
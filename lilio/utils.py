@@ -1,5 +1,6 @@
 """Commonly used utility functions for Lilio."""
 
+import functools
 import re
 import typing
 import warnings
@@ -14,6 +15,32 @@ if typing.TYPE_CHECKING:
 
 
 MONTH_LENGTH = 30  # Month length for Timedelta checks.
+# English lowercase month names and abbreviations, with the number of each month.
+MONTH_NAMES = {
+    "january": 1,
+    "february": 2,
+    "march": 3,
+    "april": 4,
+    "may": 5,
+    "june": 6,
+    "july": 7,
+    "august": 8,
+    "september": 9,
+    "october": 10,
+    "november": 11,
+    "december": 12,
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
 
 
 def check_timeseries(
@@ -61,12 +88,12 @@ def check_time_dim_pandas(data) -> None:
         raise ValueError("The input data does not have a datetime index.")
 
 
-def check_empty_intervals(indices_list: list[np.ndarray]) -> None:
+def check_empty_intervals(interval_sizes: np.ndarray) -> None:
     """Check for empty intervals in the resampling data.
 
     Args:
-        indices_list: A list, where each item is an array with indices corresponding
-            to the to-be-resampled data's time axis.
+        interval_sizes: An array with the number of datapoints of the to-be-resampled
+            data that fall within each interval.
 
     Raises:
         UserWarning: If the data is insufficient.
@@ -74,7 +101,7 @@ def check_empty_intervals(indices_list: list[np.ndarray]) -> None:
     Returns:
         None
     """
-    if any(len(interval_locs) == 1 for interval_locs in indices_list):
+    if np.any(interval_sizes == 1):
         warnings.warn(  # type: ignore
             message=(
                 "\n  Some intervals only contains a single data point."
@@ -84,7 +111,7 @@ def check_empty_intervals(indices_list: list[np.ndarray]) -> None:
             ),
             stacklevel=1,
         )
-    elif any(len(interval_locs) == 0 for interval_locs in indices_list):
+    elif np.any(interval_sizes == 0):
         warnings.warn(  # type: ignore
             message=(
                 "\n  The input data could not fully cover the calendar's intervals."
@@ -107,12 +134,14 @@ def infer_input_data_freq(
     Returns:
         a pd.Timedelta
     """
+    # The inferred frequency is cached on the (immutable) index, so repeated calls for
+    #   the same data, e.g. when resampling it to multiple calendars, are cheap.
     if isinstance(data, (pd.Series, pd.DataFrame)):
-        data_freq = pd.infer_freq(data.index)
+        data_freq = data.index.inferred_freq
         if data_freq is None:  # Manually infer the frequency
             data_freq = np.min(data.index.values[1:] - data.index.values[:-1])
     else:
-        data_freq = xr.infer_freq(data.time)
+        data_freq = data.indexes["time"].inferred_freq
         if data_freq is None:  # Manually infer the frequency
             data_freq = (data.time.values[1:] - data.time.values[:-1]).min()
 
@@ -177,38 +206,6 @@ def check_input_frequency(
         )
 
 
-def convert_interval_to_bounds(data: xr.Dataset) -> xr.Dataset:
-    """Convert pandas intervals to bounds in a xarray Dataset.
-
-    pd.Interval objects cannot be written to netCDF. To allow writing the
-    calendar-resampled data to netCDF these intervals have to be converted to bounds.
-    This function adds a 'bounds' dimension, with 'left' and 'right' coordinates, and
-    converts the 'interval' coordinates to this system.
-
-    Args:
-        data: Input data with intervals as pd.Interval objects.
-
-    Returns:
-        Input data with the intervals converted to bounds.
-    """
-    data = data.stack(coord=["anchor_year", "i_interval"])
-    bounds = np.array([[val.left, val.right] for val in data.interval.values])
-    data["left_bound"] = ("coord", bounds[:, 0])
-    data["right_bound"] = ("coord", bounds[:, 1])
-    data["left_bound"].attrs = {
-        "name": "Left bound of the interval",
-        "closed": "True",
-    }
-    data["right_bound"].attrs = {
-        "name": "Right bound of the interval",
-        "closed": "False",
-    }
-    data = data.unstack("coord")
-    data = data.drop_vars(["interval"])
-    data = data.set_coords(["left_bound", "right_bound"])
-    return data
-
-
 def check_reserved_names(
     input_data: Union[pd.Series, pd.DataFrame, xr.DataArray, xr.Dataset],
 ) -> None:
@@ -255,31 +252,7 @@ def get_month_names() -> dict:
             abbreviations, linked to the number of each month.
             E.g. {'december': 12, 'jan': 1}
     """
-    return {
-        "january": 1,
-        "february": 2,
-        "march": 3,
-        "april": 4,
-        "may": 5,
-        "june": 6,
-        "july": 7,
-        "august": 8,
-        "september": 9,
-        "october": 10,
-        "november": 11,
-        "december": 12,
-        "jan": 1,
-        "feb": 2,
-        "mar": 3,
-        "apr": 4,
-        "jun": 6,
-        "jul": 7,
-        "aug": 8,
-        "sep": 9,
-        "oct": 10,
-        "nov": 11,
-        "dec": 12,
-    }
+    return dict(MONTH_NAMES)
 
 
 def check_month_day(month: int, day: int = 1):
@@ -352,3 +325,19 @@ def parse_freqstr_to_dateoffset(time_str):
         raise ValueError("Please input a time string in the correct format.")
 
     return time_dict
+
+
+@functools.lru_cache(maxsize=512)
+def cached_parse_freqstr_to_dateoffset(time_str: str) -> dict:
+    """Parse the user-input time strings, reusing the result for repeated strings.
+
+    Calendars usually use a handful of different frequency strings for many intervals.
+    Note that the returned dictionaries are shared, and must not be modified.
+
+    Args:
+        time_str: Time length string in the right formatting.
+
+    Returns:
+        Dictionary as keyword argument for Pandas DateOffset.
+    """
+    return parse_freqstr_to_dateoffset(time_str)
@@ -1,5 +1,6 @@
 """Tests for the lilio.Calendar module."""
 
+import copy
 from typing import Literal
 import numpy as np
 import pandas as pd
@@ -50,11 +51,38 @@ class TestInterval:
         assert target.length_dateoffset == DateOffset(**a)
         assert target.gap_dateoffset == DateOffset(**b)
 
+    def test_fixed_duration_offsets(self):
+        target = Interval("target", length="3W", gap={"months": 1, "days": 2})
+        # pylint: disable=protected-access
+        assert target._length_offset == pd.Timedelta(weeks=3)
+        assert target._gap_offset == DateOffset(months=1, days=2)
+
+    def test_empty_gap(self):
+        precursor = Interval("precursor", "10d", gap={})
+        # pylint: disable=protected-access
+        assert precursor._gap_offset == DateOffset()
+
+    def test_non_integer_length(self):
+        with pytest.raises(ValueError, match="whole number"):
+            Interval("target", length={"days": 1.5})
+
+    def test_shared_offsets(self):
+        target = Interval("target", length="7d")
+        precursor = Interval("precursor", length={"days": 7}, gap="7d")
+        assert target.length_dateoffset is precursor.length_dateoffset
+        assert precursor.gap_dateoffset is precursor.length_dateoffset
+
     def test_repr(self):
         target = Interval("target", "20d", "10d")
         expected = "Interval(role='target', length='20d', gap='10d')"
         assert repr(target) == expected
 
+    def test_repr_inplace_change(self):
+        target = Interval("target", {"days": 1})
+        _ = repr(target)
+        target.length["days"] = 5
+        assert repr(target) == "Interval(role='target', length={'days': 5}, gap='0d')"
+
     def test_repr_eval(self):
         target = Interval("target", "20d", "10d")
         _ = eval(repr(target))  # pylint: disable=eval-used
@@ -128,6 +156,39 @@ class TestCalendar:
         )
         assert np.array_equal(dummy_calendar.flat, expected)
 
+    def test_change_anchor(self, dummy_calendar):
+        _ = dummy_calendar.flat
+        dummy_calendar.anchor = "11-30"
+        expected = np.array(
+            [
+                interval("2021-11-20", "2021-11-30", closed="left"),
+                interval("2021-11-30", "2021-12-20", closed="left"),
+            ]
+        )
+        assert np.array_equal(dummy_calendar.flat, expected)
+
+    def test_modify_interval_inplace(self, dummy_calendar):
+        intervals = dummy_calendar.get_intervals()
+        intervals.iloc[0, 0] = interval("2000-01-01", "2000-01-02")
+        dummy_calendar.targets[0].length = "10d"
+        expected = np.array(
+            [
+                interval("2021-12-21", "2021-12-31", closed="left"),
+                interval("2021-12-31", "2022-01-10", closed="left"),
+            ]
+        )
+        assert np.array_equal(dummy_calendar.flat, expected)
+
+    def test_deepcopy(self, dummy_calendar):
+        dummy_calendar.targets[0].gap = {"days": 1}
+        cal_copy = copy.deepcopy(dummy_calendar)
+        cal_copy.targets[0].gap["days"] = 2
+        cal_copy.targets[0].length = "10d"
+        cal_copy.add_intervals("precursor", "1d")
+        assert dummy_calendar.targets[0].gap == {"days": 1}
+        assert dummy_calendar.targets[0].length == "20d"
+        assert dummy_calendar.n_precursors == 1
+
     def test_add_intervals(self, dummy_calendar):
         dummy_calendar.add_intervals("target", "30d")
         dummy_calendar = dummy_calendar.map_years(2021, 2021)
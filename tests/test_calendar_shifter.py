@@ -51,10 +51,53 @@ class TestCalendarShifter:
         assert str(cal_shifted.targets) == str(cal_expected.targets)
         assert str(cal_expected.precursors) == str(cal_shifted.precursors)
 
+    def test_calendar_shifter_keeps_parsed_shift(self, dummy_calendar):
+        _ = calendar_shifter.calendar_shifter(dummy_calendar, "7d")
+        cal_shifted = calendar_shifter.calendar_shifter(dummy_calendar, "7d")
+        assert cal_shifted.targets[0].gap == {"days": 7}
+        assert cal_shifted.precursors[0].gap == {"days": 0}
+
+    def test_calendar_shifter_keeps_shift_dict(self, dummy_calendar):
+        shift = {"days": 7}
+        _ = calendar_shifter.calendar_shifter(dummy_calendar, shift)
+        assert shift == {"days": 7}
+
+    def test_calendar_shifter_inplace_change(self, dummy_calendar):
+        dummy_calendar.precursors[1].gap = {"days": 1}
+        cal_shifted = calendar_shifter.calendar_shifter(dummy_calendar, "7d")
+        cal_shifted.precursors[1].gap["days"] = 99
+        assert dummy_calendar.precursors[1].gap == {"days": 1}
+
+    def test_calendar_shifter_gap_keys(self, dummy_calendar):
+        cal_shifted = calendar_shifter.calendar_shifter(dummy_calendar, {"months": 1})
+        assert list(cal_shifted.targets[0].gap) == ["days", "months"]
+
+    @pytest.mark.parametrize("shift", ["0d", {}, {"days": 0, "weeks": 0}])
+    def test_calendar_shifter_zero_shift(self, dummy_calendar, shift):
+        cal_shifted = calendar_shifter.calendar_shifter(dummy_calendar, shift)
+        assert repr(cal_shifted) == repr(dummy_calendar)
+        assert cal_shifted.targets[0] is not dummy_calendar.targets[0]
+        dummy_calendar.targets[0].length = {"days": 7}
+        cal_shifted = calendar_shifter.calendar_shifter(dummy_calendar, shift)
+        cal_shifted.targets[0].length["days"] = 42
+        assert dummy_calendar.targets[0].length == {"days": 7}
+
     def test_staggered_calendar(self, dummy_calendar):
         cal_list = calendar_shifter.staggered_calendar(dummy_calendar, "7d", n_shifts=3)
         assert len(cal_list) == 4
 
+    @pytest.mark.parametrize("n_shifts", [True, 2.0, 0])
+    def test_staggered_calendar_invalid_n_shifts(self, dummy_calendar, n_shifts):
+        with pytest.raises(ValueError):
+            calendar_shifter.staggered_calendar(dummy_calendar, "7d", n_shifts)
+
+    def test_staggered_calendar_gaps(self, dummy_calendar):
+        cal_list = calendar_shifter.staggered_calendar(
+            dummy_calendar, {"weeks": 1, "days": 2}, n_shifts=3
+        )
+        assert cal_list[3].targets[0].gap == {"weeks": 3, "days": 6}
+        assert cal_list[3].precursors[0].gap == {"weeks": -3, "days": 1}
+
     def test_calendar_list_resampler(self, dummy_calendar, dummy_data):
         cal_list = calendar_shifter.staggered_calendar(
             dummy_calendar, "14d", n_shifts=5
@@ -64,3 +107,14 @@ class TestCalendarShifter:
         ds_resampled = calendar_shifter.calendar_list_resampler(cal_list, dummy_data)
         expected_coords = np.array([0, 1, 2, 3, 4, 5])
         assert np.array_equal(ds_resampled.step.values, expected_coords)
+
+    def test_staggered_resample(self, dummy_calendar, dummy_data):
+        dummy_calendar.map_to_data(dummy_data)
+        ds_resampled = calendar_shifter.staggered_resample(
+            dummy_calendar, dummy_data, "14d", n_shifts=5
+        )
+        cal_list = calendar_shifter.staggered_calendar(
+            dummy_calendar, "14d", n_shifts=5
+        )
+        expected = calendar_shifter.calendar_list_resampler(cal_list, dummy_data)
+        xr.testing.assert_identical(ds_resampled, expected)
@@ -57,8 +57,10 @@ class TestPlots:
         plt.close("all")
 
     def test_visualize_unmapped(self, isinteractive):
-        lilio.daily_calendar(anchor="12-31").visualize(interactive=isinteractive)
+        calendar = lilio.daily_calendar(anchor="12-31")
+        calendar.visualize(interactive=isinteractive)
         plt.close("all")
+        assert calendar.mapping is None
 
 
 class TestPlotsSingle:
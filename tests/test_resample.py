@@ -103,6 +103,13 @@ class TestResample:
         resampled_data = resample(cal, dataframe)
         np.testing.assert_allclose(resampled_data["data1"].iloc[:2], expected)
 
+    def test_unsorted_dataframe(self, dummy_calendar, dummy_dataframe):
+        dataframe, expected = dummy_dataframe
+        cal = dummy_calendar.map_to_data(dataframe)
+        shuffled = dataframe.sample(frac=1, random_state=0)
+        resampled_data = resample(cal, shuffled)
+        np.testing.assert_allclose(resampled_data["data1"].iloc[:2], expected)
+
     def test_dataarray(self, dummy_calendar, dummy_dataarray):
         dataarray, expected = dummy_dataarray
         cal = dummy_calendar.map_to_data(dataarray)
@@ -123,6 +130,57 @@ class TestResample:
         assert np.all([dim in resampled_data.dims for dim in ["x", "y"]])
         assert np.all([var in resampled_data.variables for var in ["temp", "prec"]])
 
+    def test_multidim_dataset_values(self, dummy_calendar, dummy_multidimensional):
+        cal = dummy_calendar.map_to_data(dummy_multidimensional)
+        resampled_data = resample(cal, dummy_multidimensional)
+        expected = resample(cal, dummy_multidimensional.isel(x=1, y=0))
+        np.testing.assert_allclose(
+            resampled_data["temp"].isel(x=1, y=0), expected["temp"]
+        )
+
+    def test_same_frequency_dataframe(self):
+        cal = daily_calendar(anchor="10-15", length="10d")
+        cal.map_years(2016, 2018)
+        time_index = pd.DatetimeIndex([iv.left for iv in cal.flat]).sort_values()
+        df = pd.DataFrame({"data1": np.random.random(len(time_index))}, time_index)
+        with pytest.warns(UserWarning):
+            resampled_data = resample(cal, df, how="median")
+        left_bounds = pd.DatetimeIndex([iv.left for iv in resampled_data["interval"]])
+        np.testing.assert_array_equal(
+            resampled_data["data1"].values, df.loc[left_bounds, "data1"].values
+        )
+
+    def test_same_frequency_dataarray_writeable(self):
+        time_index = pd.date_range("2019-01-01", "2021-12-31", freq="1d")
+        data = xr.DataArray(
+            np.random.random(len(time_index)), coords={"time": time_index}
+        )
+        cal = daily_calendar(anchor="10-15", length="7d").map_to_data(data)
+        resampled_data = resample(cal, data)
+        assert resampled_data.values.flags.writeable
+        resampled_data -= resampled_data.mean("anchor_year")
+
+    def test_float32_dataframe(self, dummy_calendar, dummy_dataframe):
+        df, _ = dummy_dataframe
+        df = df.assign(data2=df["data1"].astype(np.float32))
+        cal = dummy_calendar.map_to_data(df)
+        resampled_data = resample(cal, df)
+        assert resampled_data["data1"].dtype == np.float64
+        assert resampled_data["data2"].dtype == np.float32
+        assert list(resampled_data.columns[-3:-1]) == ["data1", "data2"]
+
+    @pytest.mark.parametrize("how", ["sum", "max", "size", "count_nonzero"])
+    def test_nonfloat_dataframe(self, dummy_calendar, dummy_dataframe, how):
+        df, _ = dummy_dataframe
+        df = df.assign(data2=df["data1"].astype(np.float32), data3=np.arange(len(df)))
+        cal = dummy_calendar.map_to_data(df)
+        resampled_data = resample(cal, df, how=how)
+        assert resampled_data["data3"].dtype == np.float64
+        expected_float32 = (
+            np.float64 if how in ("size", "count_nonzero") else np.float32
+        )
+        assert resampled_data["data2"].dtype == expected_float32
+
     def test_target_period_dataframe(self, dummy_calendar_targets, dummy_dataframe):
         df, _ = dummy_dataframe
         calendar = dummy_calendar_targets.map_to_data(df)
@@ -386,6 +444,42 @@ class TestResampleMethods:
         cal = dummy_calendar.map_to_data(data)
         resample(cal, data, how=resampling_method)
 
+    @pytest.mark.parametrize(
+        "resampling_method", ["sum", "nansum", "mean", "nanmean", "min", "max", "ptp"]
+    )
+    def test_reduceat_methods_uneven_intervals(self, resampling_method):
+        time_index = pd.date_range("2015-01-01", "2018-12-31", freq="1d")
+        test_data = np.random.random(len(time_index))
+        test_data[::5] = np.nan
+        data = pd.Series(test_data, index=time_index, name="data1")
+        cal = monthly_calendar(anchor="Dec").map_to_data(data)
+        resampled_data = resample(cal, data, how=resampling_method)
+        expected = [
+            getattr(np, resampling_method)(data[iv.left : iv.right].to_numpy()[:-1])
+            for iv in resampled_data["interval"]
+        ]
+        np.testing.assert_allclose(resampled_data["data1"], expected)
+
+    @pytest.mark.parametrize(
+        "resampling_method", ["sum", "nansum", "mean", "nanmean", "min", "max", "ptp"]
+    )
+    def test_reduceat_methods_uneven_intervals_multidim(self, resampling_method):
+        time_index = pd.date_range("2015-01-01", "2018-12-31", freq="1d")
+        test_data = np.random.random((3, len(time_index)))
+        test_data[:, ::5] = np.nan
+        data = xr.DataArray(
+            test_data, dims=("x", "time"), coords={"time": time_index}, name="data1"
+        )
+        cal = monthly_calendar(anchor="Dec").map_to_data(data)
+        resampled_data = resample(cal, data, how=resampling_method)
+        expected = resample(
+            cal, data.to_pandas().T.add_prefix("x"), how=resampling_method
+        )
+        for x in range(3):
+            np.testing.assert_allclose(
+                resampled_data.isel(x=x).values.ravel(), expected[f"x{x}"]
+            )
+
     def test_func_input_dataframe(self, dummy_calendar, dummy_dataframe):
         data, _ = dummy_dataframe
         cal = dummy_calendar.map_to_data(data)
@@ -396,6 +490,29 @@ class TestResampleMethods:
         cal = dummy_calendar.map_to_data(data)
         resample(cal, data, how=np.mean)
 
+    def test_func_input_multiple_values_dataset(self, dummy_calendar, dummy_dataset):
+        """Functions should only be called on the data within the intervals."""
+        data, _ = dummy_dataset
+        cal = dummy_calendar.map_to_data(data)
+        resampled_data = resample(cal, data, how=lambda x: x[1] - x[0])
+        expected = resample(cal, data.to_dataframe(), how=lambda x: x[1] - x[0])
+        np.testing.assert_allclose(
+            resampled_data["data1"].values.ravel(), expected["data1"]
+        )
+        dask_resampled_data = resample(
+            cal, data.chunk({"time": 5}), how=lambda x: x[1] - x[0]
+        )
+        xr.testing.assert_identical(dask_resampled_data.compute(), resampled_data)
+
+    @pytest.mark.parametrize("how", [np.mean, np.median, lambda x: x.mean()])
+    def test_func_input_integer_dask(self, dummy_calendar, dummy_dataset, how):
+        data, _ = dummy_dataset
+        data = data.assign(data1=("time", np.arange(data["time"].size)))
+        cal = dummy_calendar.map_to_data(data)
+        resampled_data = resample(cal, data.chunk({"time": 5}), how=how)
+        assert resampled_data["data1"].dtype == np.float64
+        assert resampled_data["data1"].compute().dtype == np.float64
+
 
 class TestResampleDask:
     """Test resampling, general tests for how=mean."""